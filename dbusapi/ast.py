@@ -108,10 +108,17 @@ class BaseNode(object):
         for annotation in (annotations or {}).values():
             self._add_child(annotation)
 
+    # pylint: disable=too-many-arguments
     @classmethod
-    def from_xml(cls, node, comment, log, parent=None):
-        """Return a new ast.BaseNode instance from an XML node."""
+    def from_xml(cls, node, comment, log, parent=None, parse_children=True):
+        """
+        Return a new ast.BaseNode instance from an XML node.
+
+        If `parse_children` is False, the XML node's children are not parsed,
+        and must be passed to `parse_xml_child()` by the caller.
+        """
         attrs = {}
+        xml_attrs = node.attrib
 
         valid = True
         for attr_name in cls.required_attributes:
@@ -121,7 +128,7 @@ class BaseNode(object):
                 member_name = 'type_'
 
             try:
-                attrs[member_name] = node.attrib[attr_name]
+                attrs[member_name] = xml_attrs[attr_name]
             except KeyError:
                 log.log_issue('missing-attribute',
                               'Missing required attribute ‘%s’ in %s.' %
@@ -132,7 +139,7 @@ class BaseNode(object):
             return None
 
         for attr_name in cls.optional_attributes:
-            attrs[attr_name] = node.attrib.get(attr_name)
+            attrs[attr_name] = xml_attrs.get(attr_name)
 
         # FIXME: Hack for the fact that Node.name and Argument.name are not
         # actually required, but is the first attribute in the constructor, and
@@ -157,7 +164,8 @@ class BaseNode(object):
         if parent:
             parent.add_child(res)
 
-        res.parse_xml_children(node)
+        if parse_children:
+            res.parse_xml_children(node)
         return res
 
     def add_child(self, child):
@@ -168,38 +176,66 @@ class BaseNode(object):
         """Parse the XML node's children."""
         xml_comment = None
         for elem in node:
-            if elem.tag == etree.Comment:
-                xml_comment = elem
-                continue
+            xml_comment = self.parse_xml_child(elem, xml_comment)
 
-            elif elem.tag in BaseNode.DOCSTRING_TAGS:
-                self.comment_line_number = elem.sourceline
-                self.comment = elem.text
-                continue
+    def parse_xml_child(self, elem, xml_comment):
+        """
+        Parse a single child of the XML node.
 
-            elif ignore_node(elem):
-                xml_comment = None
-                continue
+        Args:
+            elem: the XML child element to parse
+            xml_comment: the XML comment preceding `elem`, or None
 
-            try:
-                ctype = self._children_types[elem.tag]
-            except KeyError:
-                xml_comment = None
-                if isinstance(self, Node) and not self.pretty_name:
-                    # Special handling for root nodes to allow more meaningful
-                    #   error messages.
-                    self.__log_issue('unknown-node',
-                                     "Unknown node ‘%s’ in root." % elem.tag)
-                else:
-                    self.__log_issue('unknown-node',
-                                     "Unknown node ‘%s’ in %s ‘%s’." %
-                                     (elem.tag, type(self).__name__.lower(),
-                                      self.pretty_name))
-                continue
-
-            ctype.from_xml(elem, xml_comment, parent=self,
-                           log=self.log)
-            xml_comment = None
+        Returns:
+            The XML comment to pass in when parsing the next child, or None.
+        """
+        # Each access to elem.tag goes through lxml; only do it once.
+        tag = elem.tag
+
+        try:
+            handler = BaseNode._XML_HANDLERS[tag]
+        except KeyError:
+            pass
+        else:
+            return handler(self, elem, xml_comment)
+
+        if tag[0] == '{':  # in a namespace; see ignore_node()
+            return None
+
+        try:
+            ctype = self._children_types[tag]
+        except KeyError:
+            if isinstance(self, Node) and not self.pretty_name:
+                # Special handling for root nodes to allow more meaningful
+                #   error messages.
+                self.__log_issue('unknown-node',
+                                 "Unknown node ‘%s’ in root." % tag)
+            else:
+                self.__log_issue('unknown-node',
+                                 "Unknown node ‘%s’ in %s ‘%s’." %
+                                 (tag, type(self).__name__.lower(),
+                                  self.pretty_name))
+            return None
+
+        ctype.from_xml(elem, xml_comment, parent=self,
+                       log=self.log)
+        return None
+
+    def _parse_xml_comment(self, elem, _xml_comment):
+        return elem
+
+    def _parse_xml_docstring(self, elem, xml_comment):
+        self.comment_line_number = elem.sourceline
+        self.comment = elem.text
+        return xml_comment
+
+    # Handlers for XML children which are not AST nodes, mapping the XML tag
+    # to a handler with the same signature as parse_xml_child().
+    _XML_HANDLERS = {
+        etree.Comment: _parse_xml_comment,
+        DOCSTRING_TAGS[0]: _parse_xml_docstring,
+        DOCSTRING_TAGS[1]: _parse_xml_docstring,
+    }
 
     def walk(self):
         """Traverse this node's children in pre-order."""
@@ -510,6 +546,15 @@ class Callable(BaseNode):
             return False
         return super(Callable, self)._child_is_duplicate(child)
 
+    def _add_child(self, child):
+        added = super(Callable, self)._add_child(child)
+        if added and isinstance(child, Argument):
+            # Record the index now, rather than scanning the argument list
+            # for it later.
+            # pylint: disable=protected-access
+            child._index = len(self.arguments) - 1
+        return added
+
     @property
     def pretty_name(self):
         """Format the callable's name as a human-readable string"""
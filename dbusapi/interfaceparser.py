@@ -20,19 +20,14 @@ Module providing an `InterfaceParser` object for parsing D-Bus introspection
 XML files into abstract syntax trees (ASTs).
 """
 
+import io
+import re
+
 # pylint: disable=no-member
 from lxml import etree
 from dbusapi.ast import AstLog, Node, TP_DTD
 
 
-def _skip_non_node(elem):
-    for node in elem.getchildren():
-        if node.tag == 'node':
-            return node
-
-    return None
-
-
 class ParsingLog(AstLog):
 
     """A specialized AstLog subclass for parsing issues"""
@@ -62,40 +57,107 @@ class InterfaceParser(object):
     general code. It ignores certain common extensions found in introspection
     XML files, such as documentation elements, but will fail on other
     unrecognised elements.
+
+    The XML is parsed incrementally, and each child of the root node is
+    discarded once it has been converted to an AST, so the whole XML tree is
+    never held in memory at once.
     """
 
-    def __init__(self, filename):
+    # Cache for get_output_codes().
+    _output_codes = None
+
+    def __init__(self, filename, base_name=None):
         """
         Construct a new InterfaceParser.
 
         Args:
-            filename: path to the XML introspection file to parse
+            filename: path to the XML introspection file to parse, or a
+                file-like object to read the XML from
+            base_name: name to use for the file in log messages, or None to
+                use `filename` if it is a path, or ‘<string>’ otherwise
         """
+        if base_name is None:
+            base_name = '<string>' if hasattr(filename, 'read') else filename
+
         self._filename = filename
-        self._log = ParsingLog(filename)
+        self._log = ParsingLog(base_name)
 
-    @staticmethod
-    def get_output_codes():
+        # Position to read a seekable file object from on each parse.
+        self._offset = None
+        if hasattr(filename, 'seekable') and filename.seekable():
+            self._offset = filename.tell()
+
+    @classmethod
+    def from_string(cls, xml, base_name='<string>'):
+        """
+        Construct a new InterfaceParser for an XML string.
+
+        Args:
+            xml: str or bytes, the XML introspection document to parse;
+                str is encoded as UTF-8, and bytes are parsed as-is
+            base_name: name to use for the document in log messages
+
+        Raises:
+            ValueError: if `xml` is a str with an encoding declaration, which
+                would conflict with encoding it as UTF-8
+        """
+        if isinstance(xml, str):
+            if re.match(r'\s*<\?xml[^>]*\sencoding\s*=', xml):
+                raise ValueError('Unicode strings with encoding declaration '
+                                 'are not supported; use bytes input.')
+            xml = xml.encode('utf-8')
+
+        return cls(io.BytesIO(xml), base_name)
+
+    @classmethod
+    def get_output_codes(cls):
         """Return a list of all possible output codes."""
-        return ParsingLog(None).issue_codes
+        if cls._output_codes is None:
+            cls._output_codes = frozenset(ParsingLog(None).issue_codes)
+        return set(cls._output_codes)
 
     def get_output(self):
         """Return a list of all logged parser messages."""
         return self._log.issues
 
-    def _get_root(self):
-        root = etree.parse(self._filename).getroot()
+    def _find_root(self, events):
+        """Consume parser events up to the start of the root node."""
+        for (event, elem) in events:
+            if event != 'start':
+                continue
 
-        # Handle specifications wrapped in tp:spec.
-        if root.tag == '{%s}spec' % TP_DTD:
-            root = _skip_non_node(root)
+            parent = elem.getparent()
+            if parent is None:
+                if elem.tag == 'node':
+                    return elem
 
-        if root is not None and root.tag != 'node':
-            self._log.log_issue('unknown-node',
-                                'Unknown root node ‘%s’.' % root.tag)
-            root = _skip_non_node(root)
+                # Handle specifications wrapped in tp:spec.
+                if elem.tag != '{%s}spec' % TP_DTD:
+                    self._log.log_issue('unknown-node',
+                                        'Unknown root node ‘%s’.' % elem.tag)
+            elif parent.getparent() is None and elem.tag == 'node':
+                return elem
 
-        return root
+        return None
+
+    @staticmethod
+    def _parse_root_children(root, root_node, events):
+        """Consume parser events up to the end of the root node."""
+        xml_comment = None
+        for (event, elem) in events:
+            if elem is root:
+                break
+            if event == 'start' or elem.getparent() is not root:
+                continue
+
+            xml_comment = root_node.parse_xml_child(elem, xml_comment)
+
+            # Drop the parsed XML, which is no longer needed. Comments are
+            # kept alive by xml_comment if they are still needed.
+            if event == 'end':
+                elem.clear()
+            while elem.getprevious() is not None:
+                del root[0]
 
     def parse_with_nodes(self):
         """
@@ -107,11 +169,26 @@ class InterfaceParser(object):
         """
         self._log.clear()
 
-        root = self._get_root()
+        # Parse file objects from their original position each time, so the
+        # parser can be re-run, as it can for paths.
+        if self._offset is not None:
+            self._filename.seek(self._offset)
+
+        events = etree.iterparse(self._filename,
+                                 events=('start', 'end', 'comment'),
+                                 remove_blank_text=False, huge_tree=False)
+
+        root = self._find_root(events)
         if root is None:
             return None
 
-        root_node = Node.from_xml(root, None, self._log)
+        root_node = Node.from_xml(root, None, self._log,
+                                  parse_children=False)
+        self._parse_root_children(root, root_node, events)
+
+        # Check the rest of the document is well-formed.
+        for _ in events:
+            pass
 
         if root_node.name and \
            not Node.is_valid_absolute_object_path(root_node.name):
@@ -60,3 +60,14 @@ class Log(object):
     def clear(self):
         """Clear the issue list."""
         self.issues = []
+
+    def consume_issues(self):
+        """
+        Clear the issue list, returning the issues which were in it.
+
+        Returns:
+            The list of issues logged since the last call to `clear()` or
+            `consume_issues()`.
+        """
+        issues, self.issues = self.issues, []
+        return issues
@@ -213,6 +213,13 @@ class TestAstParenting(unittest.TestCase):
         self.assertEqual(arg.parent, method)
         self.assertEqual(arg.index, 0)
 
+    def test_argument_indices(self):
+        args = [ast.Argument('Arg%u' % i, ast.Argument.DIRECTION_IN, 's')
+                for i in range(3)]
+        method = ast.Method('AMethod', args[:2])
+        method.add_child(args[2])
+        self.assertEqual([arg.index for arg in args], [0, 1, 2])
+
 
 class TestAstTraversal(unittest.TestCase):
     """Test AST traversal."""
@@ -254,15 +261,16 @@ class TestAstLogging(unittest.TestCase):
         iface = ast.Interface('Some.Interface', {
             'AMethod': method,
         })
-        self.assertListEqual(iface.log.issues, [])
+        self.assertListEqual(iface.log.consume_issues(), [])
         duplicate_method = ast.Method('AMethod', [])
         iface.add_child(duplicate_method)
         self.assertListEqual(
-            iface.log.issues,
+            iface.log.consume_issues(),
             [(None,
               'ast',
               'duplicate-method',
               'Duplicate method definition ‘Some.Interface.AMethod’.')])
+        self.assertListEqual(iface.log.issues, [])
 
 
 if __name__ == '__main__':
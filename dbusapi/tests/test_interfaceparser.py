@@ -25,38 +25,225 @@ Unit tests for dbusapi.interfaceparser
 
 
 from dbusapi.interfaceparser import InterfaceParser
-import os
-import tempfile
+import io
 import unittest
 
 
-def _create_temp_xml_file(xml):
-    """Create a temporary XML file with the given contents."""
-    tmp_fd, tmp_name = tempfile.mkstemp(suffix='.xml', text=True)
-    xml_fd = os.fdopen(tmp_fd, 'wt')
-    xml_fd.write(xml)
-    xml_fd.close()
-
-    return tmp_name
+_TP_NS = 'http://telepathy.freedesktop.org/wiki/DbusSpec#extensions-v0'
+_DOC_NS = 'http://www.freedesktop.org/dbus/1.0/doc.dtd'
+_NODE_HEADER = "<node xmlns:tp='%s' xmlns:doc='%s'>" % (_TP_NS, _DOC_NS)
 
 
 def _test_parser_with_nodes(xml):
     """Build an InterfaceParser for the XML snippet and parse it."""
-    tmpfile = _create_temp_xml_file(xml)
-    parser = InterfaceParser(tmpfile)
+    filename = '<string>'
+    parser = InterfaceParser.from_string(xml, filename)
     root_node = parser.parse_with_nodes()
-    os.unlink(tmpfile)
-    return parser, root_node, tmpfile
+    return parser, root_node, filename
 
 
 def _test_parser(xml):
     """Build an InterfaceParser for the XML snippet and parse it."""
-    parser, root_node, tmpfile = _test_parser_with_nodes(xml)
+    parser, root_node, filename = _test_parser_with_nodes(xml)
     interfaces = root_node.interfaces if root_node else None
-    return parser, interfaces, tmpfile
+    return parser, interfaces, filename
+
+
+# Each case is a tuple of (name, xml, partial_output), where xml is the
+# encoded XML to parse and partial_output is the list of (code, message) pairs
+# the parser is expected to output.
+_ERROR_CASES = [
+    ('unknown_root_node',
+     b"<notnode><irrelevant/></notnode>", [
+         ('unknown-node', 'Unknown root node ‘notnode’.'),
+     ]),
+    ('invalid_interface_name',
+     b"<node><interface name='0'/></node>", [
+         ('interface-name',
+          'Invalid interface name ‘0’.'),
+     ]),
+    ('duplicate_interface',
+     b"<node><interface name='I.I'/><interface name='I.I'/></node>", [
+         ('duplicate-interface',
+          'Duplicate interface definition ‘I.I’.'),
+     ]),
+    ('unknown_interface_node',
+     b"<node><badnode/></node>", [
+         ('unknown-node', 'Unknown node ‘badnode’ in root.'),
+     ]),
+    ('interface_missing_name',
+     b"<node><interface/></node>", [
+         ('missing-attribute',
+          'Missing required attribute ‘name’ in interface.'),
+     ]),
+    ('invalid_method',
+     b"<node><interface name='I.I'>"
+     b"<method name='0M'/>"
+     b"</interface></node>", [
+         ('method-name',
+          'Invalid method name ‘0M’.'),
+     ]),
+    ('duplicate_method',
+     b"<node><interface name='I.I'>"
+     b"<method name='M'/><method name='M'/>"
+     b"</interface></node>", [
+         ('duplicate-method',
+          'Duplicate method definition ‘I.I.M’.'),
+     ]),
+    ('invalid_signal',
+     b"<node><interface name='I.I'>"
+     b"<signal name='*S'/>"
+     b"</interface></node>", [
+         ('signal-name',
+          'Invalid signal name ‘*S’.'),
+     ]),
+    ('duplicate_signal',
+     b"<node><interface name='I.I'>"
+     b"<signal name='S'/><signal name='S'/>"
+     b"</interface></node>", [
+         ('duplicate-signal',
+          'Duplicate signal definition ‘I.I.S’.'),
+     ]),
+    ('invalid_signal_signature',
+     b"<node><interface name='I.I'>"
+     b"<signal name='S'><arg name='N' type='?'/></signal>"
+     b"</interface></node>", [
+         ('argument-type',
+          'Error when parsing type ‘?’ for argument ‘N’: '
+          'Reserved type ‘?’ must not be used in signatures on D-Bus.'),
+     ]),
+    ('duplicate_property',
+     b"<node><interface name='I.I'>"
+     b"<property name='P' type='s' access='readwrite'/>"
+     b"<property name='P' type='s' access='readwrite'/>"
+     b"</interface></node>", [
+         ('duplicate-property',
+          'Duplicate property definition ‘I.I.P’.'),
+     ]),
+    ('invalid_property_signature',
+     b"<node><interface name='I.I'>"
+     b"<property name='P' type='a?' access='readwrite'/>"
+     b"</interface></node>", [
+         ('property-type',
+          'Error when parsing type ‘a?’ for property ‘P’: '
+          'Reserved type ‘?’ must not be used in signatures on D-Bus.'),
+     ]),
+    ('unknown_sub_interface_node',
+     b"<node><interface name='I.I'><badnode/></interface></node>", [
+         ('unknown-node', 'Unknown node ‘badnode’ in interface ‘I.I’.'),
+     ]),
+    ('method_missing_name',
+     b"<node><interface name='I.I'><method/></interface></node>", [
+         ('missing-attribute',
+          'Missing required attribute ‘name’ in method.'),
+     ]),
+    ('unknown_method_node',
+     b"<node><interface name='I.I'>"
+     b"<method name='M'><badnode/></method>"
+     b"</interface></node>", [
+         ('unknown-node', 'Unknown node ‘badnode’ in method ‘I.I.M’.'),
+     ]),
+    ('signal_missing_name',
+     b"<node><interface name='I.I'><signal/></interface></node>", [
+         ('missing-attribute',
+          'Missing required attribute ‘name’ in signal.'),
+     ]),
+    ('unknown_signal_node',
+     b"<node><interface name='I.I'>"
+     b"<signal name='S'><badnode/></signal>"
+     b"</interface></node>", [
+         ('unknown-node', 'Unknown node ‘badnode’ in signal ‘I.I.S’.'),
+     ]),
+    ('property_missing_name',
+     b"<node><interface name='I.I'>"
+     b"<property type='s' access='readwrite'/>"
+     b"</interface></node>", [
+         ('missing-attribute',
+          'Missing required attribute ‘name’ in property.'),
+     ]),
+    ('property_missing_type',
+     b"<node><interface name='I.I'>"
+     b"<property name='P' access='readwrite'/>"
+     b"</interface></node>", [
+         ('missing-attribute',
+          'Missing required attribute ‘type’ in property.'),
+     ]),
+    ('property_missing_access',
+     b"<node><interface name='I.I'>"
+     b"<property name='P' type='s'/>"
+     b"</interface></node>", [
+         ('missing-attribute',
+          'Missing required attribute ‘access’ in property.'),
+     ]),
+    ('unknown_property_node',
+     b"<node><interface name='I.I'>"
+     b"<property name='P' type='s' access='readwrite'>"
+     b"<badnode/>"
+     b"</property>"
+     b"</interface></node>", [
+         ('unknown-node',
+          'Unknown node ‘badnode’ in property ‘I.I.P’.'),
+     ]),
+    ('unknown_arg_node',
+     b"<node><interface name='I.I'>"
+     b"<method name='M'><arg type='s'><badnode/></arg></method>"
+     b"</interface></node>", [
+         ('unknown-node',
+          'Unknown node ‘badnode’ in argument ‘0 of method ‘I.I.M’’.'),
+     ]),
+    ('arg_missing_type',
+     b"<node><interface name='I.I'>"
+     b"<method name='M'><arg/></method>"
+     b"</interface></node>", [
+         ('missing-attribute',
+          'Missing required attribute ‘type’ in arg.'),
+     ]),
+    ('annotation_missing_name',
+     b"<node><interface name='I.I'>"
+     b"<annotation value='V'/>"
+     b"</interface></node>", [
+         ('missing-attribute',
+          'Missing required attribute ‘name’ in annotation.'),
+     ]),
+    ('unknown_annotation_node',
+     b"<node><interface name='I.I'>"
+     b"<annotation name='N' value='V'><badnode/></annotation>"
+     b"</interface></node>", [
+         ('unknown-node',
+          'Unknown node ‘badnode’ in annotation ‘N of ‘I.I’’.'),
+     ]),
+]
+
+# As _ERROR_CASES, but checked using InterfaceParser.parse_with_nodes().
+_ERROR_CASES_WITH_NODES = [
+    ('nonabsolute_node_name',
+     b"<node name='rel/N'></node>", [
+         ('node-name',
+          'Root node name is not an absolute object path ‘rel/N’.'),
+     ]),
+    ('invalid_node_name',
+     b"<node name='//'></node>", [
+         ('node-name',
+          'Root node name is not an absolute object path ‘//’.'),
+     ]),
+    ('missing_node_name',
+     b"<node><node /></node>", [
+         ('missing-attribute',
+          'Missing required attribute ‘name’ in non-root node.'),
+     ]),
+    ('nonrelative_node_name',
+     b"<node><node name='/abs/N'/></node>", [
+         ('node-name',
+          'Non-root node name is not a relative object path ‘/abs/N’.'),
+     ]),
+    ('duplicate_node',
+     b"<node><node name='N'/><node name='N'/></node>", [
+         ('duplicate-node',
+          'Duplicate node definition ‘N’.'),
+     ]),
+]
 
 
-# pylint: disable=too-many-public-methods
 class TestParserErrors(unittest.TestCase):
     """Test error handling in the InterfaceParser."""
 
@@ -76,249 +263,70 @@ class TestParserErrors(unittest.TestCase):
             [(filename, 'parser', i[0], i[1]) for i in partial_output]
         self.assertEqual(parser.get_output(), actual_output)
 
-    def test_unknown_root_node(self):
-        self.assertOutput(
-            "<notnode><irrelevant/></notnode>", [
-                ('unknown-node', 'Unknown root node ‘notnode’.'),
-            ])
-
-    def test_nonabsolute_node_name(self):
-        self.assertOutputWithNodes(
-            "<node name='rel/N'></node>", [
-                ('node-name',
-                 'Root node name is not an absolute object path ‘rel/N’.'),
-            ])
-
-    def test_invalid_node_name(self):
-        self.assertOutputWithNodes(
-            "<node name='//'></node>", [
-                ('node-name',
-                 'Root node name is not an absolute object path ‘//’.'),
-            ])
-
-    def test_missing_node_name(self):
-        self.assertOutputWithNodes(
-            "<node><node /></node>", [
-                ('missing-attribute',
-                 'Missing required attribute ‘name’ in non-root node.'),
-            ])
-
-    def test_nonrelative_node_name(self):
-        self.assertOutputWithNodes(
-            "<node><node name='/abs/N'/></node>", [
-                ('node-name',
-                 'Non-root node name is not a relative object path ‘/abs/N’.'),
-            ])
-
-    def test_duplicate_node(self):
-        self.assertOutputWithNodes(
-            "<node><node name='N'/><node name='N'/></node>", [
-                ('duplicate-node',
-                 'Duplicate node definition ‘N’.'),
-            ])
-
-    def test_invalid_interface_name(self):
-        self.assertOutput(
-            "<node><interface name='0'/></node>", [
-                ('interface-name',
-                 'Invalid interface name ‘0’.'),
-            ])
-
-    def test_duplicate_interface(self):
-        self.assertOutput(
-            "<node><interface name='I.I'/><interface name='I.I'/></node>", [
-                ('duplicate-interface',
-                 'Duplicate interface definition ‘I.I’.'),
-            ])
-
-    def test_unknown_interface_node(self):
-        self.assertOutput(
-            "<node><badnode/></node>", [
-                ('unknown-node', 'Unknown node ‘badnode’ in root.'),
-            ])
-
-    def test_interface_missing_name(self):
-        self.assertOutput(
-            "<node><interface/></node>", [
-                ('missing-attribute',
-                 'Missing required attribute ‘name’ in interface.'),
-            ])
-
-    def test_invalid_method(self):
-        self.assertOutput(
-            "<node><interface name='I.I'>"
-            "<method name='0M'/>"
-            "</interface></node>", [
-                ('method-name',
-                 'Invalid method name ‘0M’.'),
-            ])
-
-    def test_duplicate_method(self):
-        self.assertOutput(
-            "<node><interface name='I.I'>"
-            "<method name='M'/><method name='M'/>"
-            "</interface></node>", [
-                ('duplicate-method',
-                 'Duplicate method definition ‘I.I.M’.'),
-            ])
-
-    def test_invalid_signal(self):
-        self.assertOutput(
-            "<node><interface name='I.I'>"
-            "<signal name='*S'/>"
-            "</interface></node>", [
-                ('signal-name',
-                 'Invalid signal name ‘*S’.'),
-            ])
-
-    def test_duplicate_signal(self):
-        self.assertOutput(
-            "<node><interface name='I.I'>"
-            "<signal name='S'/><signal name='S'/>"
-            "</interface></node>", [
-                ('duplicate-signal',
-                 'Duplicate signal definition ‘I.I.S’.'),
-            ])
-
-    def test_invalid_signal_signature(self):
-        self.assertOutput(
-            "<node><interface name='I.I'>"
-            "<signal name='S'><arg name='N' type='?'/></signal>"
-            "</interface></node>", [
-                ('argument-type',
-                 'Error when parsing type ‘?’ for argument ‘N’: '
-                 'Reserved type ‘?’ must not be used in signatures on D-Bus.'),
-            ])
-
-    def test_duplicate_property(self):
-        self.assertOutput(
-            "<node><interface name='I.I'>"
-            "<property name='P' type='s' access='readwrite'/>"
-            "<property name='P' type='s' access='readwrite'/>"
-            "</interface></node>", [
-                ('duplicate-property',
-                 'Duplicate property definition ‘I.I.P’.'),
-            ])
-
-    def test_invalid_property_signature(self):
-        self.assertOutput(
-            "<node><interface name='I.I'>"
-            "<property name='P' type='a?' access='readwrite'/>"
-            "</interface></node>", [
-                ('property-type',
-                 'Error when parsing type ‘a?’ for property ‘P’: '
-                 'Reserved type ‘?’ must not be used in signatures on D-Bus.'),
-            ])
-
-    def test_unknown_sub_interface_node(self):
-        self.assertOutput(
-            "<node><interface name='I.I'><badnode/></interface></node>", [
-                ('unknown-node', 'Unknown node ‘badnode’ in interface ‘I.I’.'),
-            ])
-
-    def test_method_missing_name(self):
-        self.assertOutput(
-            "<node><interface name='I.I'><method/></interface></node>", [
-                ('missing-attribute',
-                 'Missing required attribute ‘name’ in method.'),
-            ])
-
-    def test_unknown_method_node(self):
-        self.assertOutput(
-            "<node><interface name='I.I'>"
-            "<method name='M'><badnode/></method>"
-            "</interface></node>", [
-                ('unknown-node', 'Unknown node ‘badnode’ in method ‘I.I.M’.'),
-            ])
-
-    def test_signal_missing_name(self):
-        self.assertOutput(
-            "<node><interface name='I.I'><signal/></interface></node>", [
-                ('missing-attribute',
-                 'Missing required attribute ‘name’ in signal.'),
-            ])
-
-    def test_unknown_signal_node(self):
-        self.assertOutput(
-            "<node><interface name='I.I'>"
-            "<signal name='S'><badnode/></signal>"
-            "</interface></node>", [
-                ('unknown-node', 'Unknown node ‘badnode’ in signal ‘I.I.S’.'),
-            ])
-
-    def test_property_missing_name(self):
-        self.assertOutput(
-            "<node><interface name='I.I'>"
-            "<property type='s' access='readwrite'/>"
-            "</interface></node>", [
-                ('missing-attribute',
-                 'Missing required attribute ‘name’ in property.'),
-            ])
-
-    def test_property_missing_type(self):
-        self.assertOutput(
-            "<node><interface name='I.I'>"
-            "<property name='P' access='readwrite'/>"
-            "</interface></node>", [
-                ('missing-attribute',
-                 'Missing required attribute ‘type’ in property.'),
-            ])
-
-    def test_property_missing_access(self):
-        self.assertOutput(
-            "<node><interface name='I.I'>"
-            "<property name='P' type='s'/>"
-            "</interface></node>", [
-                ('missing-attribute',
-                 'Missing required attribute ‘access’ in property.'),
-            ])
-
-    def test_unknown_property_node(self):
-        self.assertOutput(
-            "<node><interface name='I.I'>"
-            "<property name='P' type='s' access='readwrite'>"
-            "<badnode/>"
-            "</property>"
-            "</interface></node>", [
-                ('unknown-node',
-                 'Unknown node ‘badnode’ in property ‘I.I.P’.'),
-            ])
-
-    def test_unknown_arg_node(self):
-        self.assertOutput(
-            "<node><interface name='I.I'>"
-            "<method name='M'><arg type='s'><badnode/></arg></method>"
-            "</interface></node>", [
-                ('unknown-node',
-                 'Unknown node ‘badnode’ in argument ‘0 of method ‘I.I.M’’.'),
-            ])
-
-    def test_arg_missing_type(self):
-        self.assertOutput(
-            "<node><interface name='I.I'>"
-            "<method name='M'><arg/></method>"
-            "</interface></node>", [
-                ('missing-attribute',
-                 'Missing required attribute ‘type’ in arg.'),
-            ])
-
-    def test_annotation_missing_name(self):
-        self.assertOutput(
-            "<node><interface name='I.I'>"
-            "<annotation value='V'/>"
-            "</interface></node>", [
-                ('missing-attribute',
-                 'Missing required attribute ‘name’ in annotation.'),
-            ])
-
-    def test_unknown_annotation_node(self):
-        self.assertOutput(
-            "<node><interface name='I.I'>"
-            "<annotation name='N' value='V'><badnode/></annotation>"
-            "</interface></node>", [
-                ('unknown-node',
-                 'Unknown node ‘badnode’ in annotation ‘N of ‘I.I’’.'),
-            ])
+    def test_errors(self):
+        for (name, xml, partial_output) in _ERROR_CASES:
+            with self.subTest(name=name):
+                self.assertOutput(xml, partial_output)
+
+    def test_errors_with_nodes(self):
+        for (name, xml, partial_output) in _ERROR_CASES_WITH_NODES:
+            with self.subTest(name=name):
+                self.assertOutputWithNodes(xml, partial_output)
+
+    def test_file_object_default_name(self):
+        parser = InterfaceParser(io.BytesIO(b"<notnode/>"))
+        self.assertEqual(parser.parse(), None)
+        self.assertEqual(parser.get_output(), [
+            ('<string>', 'parser', 'unknown-node',
+             'Unknown root node ‘notnode’.'),
+        ])
+
+
+# Each case is a tuple of (name, xml), where xml contains documentation tags
+# in the named type of node, which should be ignored.
+_DOC_CASES = [
+    ('root',
+     _NODE_HEADER +
+     "<tp:docstring>Ignore me.</tp:docstring>"
+     "<doc:doc>Ignore me.</doc:doc>"
+     "</node>"),
+    ('interface',
+     _NODE_HEADER +
+     "<interface name='I.I'>"
+     "<tp:docstring>Ignore me.</tp:docstring>"
+     "<doc:doc>Ignore me.</doc:doc>"
+     "</interface></node>"),
+    ('method',
+     _NODE_HEADER +
+     "<interface name='I.I'><method name='M'>"
+     "<tp:docstring>Ignore me.</tp:docstring>"
+     "<doc:doc>Ignore me.</doc:doc>"
+     "</method></interface></node>"),
+    ('signal',
+     _NODE_HEADER +
+     "<interface name='I.I'><signal name='S'>"
+     "<tp:docstring>Ignore me.</tp:docstring>"
+     "<doc:doc>Ignore me.</doc:doc>"
+     "</signal></interface></node>"),
+    ('property',
+     _NODE_HEADER +
+     "<interface name='I.I'><property name='P' type='s' access='read'>"
+     "<tp:docstring>Ignore me.</tp:docstring>"
+     "<doc:doc>Ignore me.</doc:doc>"
+     "</property></interface></node>"),
+    ('arg',
+     _NODE_HEADER +
+     "<interface name='I.I'><method name='M'><arg type='s'>"
+     "<tp:docstring>Ignore me.</tp:docstring>"
+     "<doc:doc>Ignore me.</doc:doc>"
+     "</arg></method></interface></node>"),
+    ('annotation',
+     _NODE_HEADER +
+     "<interface name='I.I'><annotation name='A' value='V'>"
+     "<tp:docstring>Ignore me.</tp:docstring>"
+     "<doc:doc>Ignore me.</doc:doc>"
+     "</annotation></interface></node>"),
+]
 
 
 # pylint: disable=too-many-public-methods
@@ -334,9 +342,8 @@ class TestParserNormal(unittest.TestCase):
     def test_tp_spec_root(self):
         """Test that specifications wrapped in tp:spec are parsed."""
         self.assertParse(
-            "<tp:spec xmlns:tp='"
-            "http://telepathy.freedesktop.org/wiki/DbusSpec#extensions-v0"
-            "'><node><interface name='I.I'/></node></tp:spec>")
+            "<tp:spec xmlns:tp='%s'>"
+            "<node><interface name='I.I'/></node></tp:spec>" % _TP_NS)
 
     def test_ignored_namespaced_tags_interface(self):
         self.assertParse(
@@ -351,96 +358,15 @@ class TestParserNormal(unittest.TestCase):
             "</ignored:spec>"
             "</interface></node>")
 
-    def test_doc_root(self):
-        """Test that doc tags are ignored in the root."""
-        self.assertParse(
-            "<node xmlns:tp='"
-            "http://telepathy.freedesktop.org/wiki/DbusSpec#extensions-v0"
-            "' xmlns:doc='"
-            "http://www.freedesktop.org/dbus/1.0/doc.dtd"
-            "'>"
-            "<tp:docstring>Ignore me.</tp:docstring>"
-            "<doc:doc>Ignore me.</doc:doc>"
-            "</node>")
-
-    def test_doc_interface(self):
-        """Test that doc tags are ignored in interfaces."""
-        self.assertParse(
-            "<node xmlns:tp='"
-            "http://telepathy.freedesktop.org/wiki/DbusSpec#extensions-v0"
-            "' xmlns:doc='"
-            "http://www.freedesktop.org/dbus/1.0/doc.dtd"
-            "'><interface name='I.I'>"
-            "<tp:docstring>Ignore me.</tp:docstring>"
-            "<doc:doc>Ignore me.</doc:doc>"
-            "</interface></node>")
-
-    def test_doc_method(self):
-        """Test that doc tags are ignored in methods."""
-        self.assertParse(
-            "<node xmlns:tp='"
-            "http://telepathy.freedesktop.org/wiki/DbusSpec#extensions-v0"
-            "' xmlns:doc='"
-            "http://www.freedesktop.org/dbus/1.0/doc.dtd"
-            "'><interface name='I.I'><method name='M'>"
-            "<tp:docstring>Ignore me.</tp:docstring>"
-            "<doc:doc>Ignore me.</doc:doc>"
-            "</method></interface></node>")
-
-    def test_doc_signal(self):
-        """Test that doc tags are ignored in signals."""
-        self.assertParse(
-            "<node xmlns:tp='"
-            "http://telepathy.freedesktop.org/wiki/DbusSpec#extensions-v0"
-            "' xmlns:doc='"
-            "http://www.freedesktop.org/dbus/1.0/doc.dtd"
-            "'><interface name='I.I'><signal name='S'>"
-            "<tp:docstring>Ignore me.</tp:docstring>"
-            "<doc:doc>Ignore me.</doc:doc>"
-            "</signal></interface></node>")
-
-    def test_doc_property(self):
-        """Test that doc tags are ignored in properties."""
-        self.assertParse(
-            "<node xmlns:tp='"
-            "http://telepathy.freedesktop.org/wiki/DbusSpec#extensions-v0"
-            "' xmlns:doc='"
-            "http://www.freedesktop.org/dbus/1.0/doc.dtd'>"
-            "<interface name='I.I'><property name='P' type='s' access='read'>"
-            "<tp:docstring>Ignore me.</tp:docstring>"
-            "<doc:doc>Ignore me.</doc:doc>"
-            "</property></interface></node>")
-
-    def test_doc_arg(self):
-        """Test that doc tags are ignored in args."""
-        self.assertParse(
-            "<node xmlns:tp='"
-            "http://telepathy.freedesktop.org/wiki/DbusSpec#extensions-v0"
-            "' xmlns:doc='"
-            "http://www.freedesktop.org/dbus/1.0/doc.dtd"
-            "'><interface name='I.I'><method name='M'><arg type='s'>"
-            "<tp:docstring>Ignore me.</tp:docstring>"
-            "<doc:doc>Ignore me.</doc:doc>"
-            "</arg></method></interface></node>")
-
-    def test_doc_annotation(self):
-        """Test that doc tags are ignored in annotations."""
-        self.assertParse(
-            "<node xmlns:tp='"
-            "http://telepathy.freedesktop.org/wiki/DbusSpec#extensions-v0"
-            "' xmlns:doc='"
-            "http://www.freedesktop.org/dbus/1.0/doc.dtd"
-            "'><interface name='I.I'><annotation name='A' value='V'>"
-            "<tp:docstring>Ignore me.</tp:docstring>"
-            "<doc:doc>Ignore me.</doc:doc>"
-            "</annotation></interface></node>")
+    def test_doc(self):
+        """Test that doc tags are ignored in all types of node."""
+        for (name, xml) in _DOC_CASES:
+            with self.subTest(name=name):
+                self.assertParse(xml)
 
     def test_doc_comments(self):
         """Test that xml comments are *not* ignored"""
-        xml = ("<node xmlns:tp='"
-               "http://telepathy.freedesktop.org/wiki/DbusSpec#extensions-v0"
-               "' xmlns:doc='"
-               "http://www.freedesktop.org/dbus/1.0/doc.dtd'>"
+        xml = (_NODE_HEADER +
                "<!--"
                "Please consider me"
                "-->"
@@ -469,10 +395,8 @@ class TestParserNormal(unittest.TestCase):
 
     def test_line_numbers(self):
         """Test that line numbers are correctly computed"""
-        xml = ("<node xmlns:tp='"
-               "http://telepathy.freedesktop.org/wiki/DbusSpec#extensions-v0"
-               "' xmlns:doc='"
-               "http://www.freedesktop.org/dbus/1.0/doc.dtd'>\n"
+        xml = (_NODE_HEADER +
+               "\n"
                "<!--\n"
                "Please consider me\n"
                "-->\n"
@@ -507,10 +431,7 @@ class TestParserNormal(unittest.TestCase):
         self.assertEqual(arg.comment_line_number, -1)
 
     def test_doc_annotations(self):
-        xml = ("<node xmlns:tp='"
-               "http://telepathy.freedesktop.org/wiki/DbusSpec#extensions-v0"
-               "' xmlns:doc='"
-               "http://www.freedesktop.org/dbus/1.0/doc.dtd'>"
+        xml = (_NODE_HEADER +
                "<interface name='I.I'>"
                "<annotation name='org.gtk.GDBus.DocString' value='bla'/>"
                "</interface></node>")
@@ -520,10 +441,7 @@ class TestParserNormal(unittest.TestCase):
         self.assertEqual(interface.comment, "bla")
 
     def test_multiline_comments(self):
-        xml = ("<node xmlns:tp='"
-               "http://telepathy.freedesktop.org/wiki/DbusSpec#extensions-v0"
-               "' xmlns:doc='"
-               "http://www.freedesktop.org/dbus/1.0/doc.dtd'>"
+        xml = (_NODE_HEADER +
                "<!--"
                "    Please consider that\n"
                "    multiline comment"
@@ -539,10 +457,7 @@ class TestParserNormal(unittest.TestCase):
                          "    multiline comment")
 
     def test_ignored_comments(self):
-        xml = ("<node xmlns:tp='"
-               "http://telepathy.freedesktop.org/wiki/DbusSpec#extensions-v0"
-               "' xmlns:doc='"
-               "http://www.freedesktop.org/dbus/1.0/doc.dtd'>"
+        xml = (_NODE_HEADER +
                "<!--"
                "Please ignore that comment"
                "-->"
@@ -605,6 +520,84 @@ class TestParserOutputCodes(unittest.TestCase):
         self.assertNotEqual(codes, [])
 
 
+class TestParserFromString(unittest.TestCase):
+    """Test the input handling of InterfaceParser.from_string()."""
+
+    _ANNOTATION = "<annotation name='I.A' value='café'/>"
+
+    def _annotation_value(self, xml):
+        root = InterfaceParser.from_string(xml).parse_with_nodes()
+        return root.interfaces['I.I'].annotations['I.A'].value
+
+    def test_str(self):
+        self.assertEqual(self._annotation_value(
+            "<node><interface name='I.I'>%s</interface></node>" %
+            self._ANNOTATION), 'café')
+
+    def test_str_declaration(self):
+        self.assertEqual(self._annotation_value(
+            "<?xml version='1.0'?><node><interface name='I.I'>%s"
+            "</interface></node>" % self._ANNOTATION), 'café')
+
+    def test_str_encoding_declaration(self):
+        with self.assertRaises(ValueError):
+            InterfaceParser.from_string(
+                "<?xml version='1.0' encoding='ISO-8859-1'?>"
+                "<node><interface name='I.I'>%s</interface></node>" %
+                self._ANNOTATION)
+
+    def test_bytes_encoding_declaration(self):
+        xml = ("<?xml version='1.0' encoding='ISO-8859-1'?>"
+               "<node><interface name='I.I'>%s</interface></node>" %
+               self._ANNOTATION)
+        self.assertEqual(self._annotation_value(xml.encode('iso-8859-1')),
+                         'café')
+
+
+class TestParserRepeated(unittest.TestCase):
+    """Test running the same InterfaceParser more than once."""
+
+    def test_file_object(self):
+        parser = InterfaceParser(io.BytesIO(
+            b"<node><interface name='I.I'/></node>"))
+        first = parser.parse()
+        self.assertEqual(parser.get_output(), [])
+        second = parser.parse()
+        self.assertEqual(parser.get_output(), [])
+        self.assertEqual(list(first.keys()), ['I.I'])
+        self.assertEqual(list(second.keys()), ['I.I'])
+
+    def test_file_object_offset(self):
+        stream = io.BytesIO(b"HEADER<node><interface name='I.I'/></node>")
+        stream.read(len(b'HEADER'))
+        parser = InterfaceParser(stream)
+        for _ in range(2):
+            interfaces = parser.parse()
+            self.assertEqual(parser.get_output(), [])
+            self.assertEqual(list(interfaces.keys()), ['I.I'])
+
+    def test_from_string(self):
+        parser = InterfaceParser.from_string(
+            "<node><interface name='I.I'/></node>")
+        first = parser.parse()
+        self.assertEqual(parser.get_output(), [])
+        second = parser.parse()
+        self.assertEqual(parser.get_output(), [])
+        self.assertEqual(list(first.keys()), ['I.I'])
+        self.assertEqual(list(second.keys()), ['I.I'])
+
+    def test_from_string_errors(self):
+        parser = InterfaceParser.from_string("<notnode/>")
+        output = [
+            ('<string>', 'parser', 'unknown-node',
+             'Unknown root node ‘notnode’.'),
+        ]
+        self.assertEqual(parser.parse_with_nodes(), None)
+        self.assertEqual(parser.get_output(), output)
+        self.assertEqual(parser.parse_with_nodes(), None)
+        self.assertEqual(parser.get_output(), output)
+
+
 # pylint: disable=too-many-public-methods
 class TestParserRecovery(unittest.TestCase):
     """
@@ -21,6 +21,9 @@ Module providing a `InterfaceComparator` object for comparing two D-Bus APIs
 they differ in API-incompatible ways.
 """
 
+from collections import deque
+from itertools import zip_longest
+
 from dbusapi import ast
 
 
@@ -31,6 +34,12 @@ WARNING_CATEGORIES = [
     'forwards-compatibility',
 ]
 
+# Names of the annotations compared by InterfaceComparator.
+_ANN_DEPRECATED = 'org.freedesktop.DBus.Deprecated'
+_ANN_CSYMBOL = 'org.freedesktop.DBus.GLib.CSymbol'
+_ANN_NOREPLY = 'org.freedesktop.DBus.Method.NoReply'
+_ANN_ECS = 'org.freedesktop.DBus.Property.EmitsChangedSignal'
+
 
 class InterfaceComparator(object):
 
@@ -55,6 +64,70 @@ class InterfaceComparator(object):
     OUTPUT_FORWARDS_INCOMPATIBLE = 'forwards-compatibility'
     OUTPUT_BACKWARDS_INCOMPATIBLE = 'backwards-compatibility'
 
+    # Output level and message for each change of EmitsChangedSignal value,
+    # mapping (old value, new value) to (level, message):
+    #
+    #                                 New
+    #                   | true | invalidates | const | false
+    #     | true        | xxxx | B2          | F3    | F3
+    # Old | invalidates | B2   | xxxxxxxxxxx | F3    | F3
+    #     | const       | B1   | B1          | xxxxx | B4
+    #     | false       | B1   | B1          | F4    | xxxxx
+    #
+    # B = Backwards-compatible; F = Forwards-compatible
+    # 1 = Started notifying
+    # 2 = Property switched lists in PropertiesChanged
+    # 3 = Stopped notifying
+    # 4 = const semantics changed
+    _ECS_TRANSITIONS = {
+        ('true', 'invalidates'): (
+            OUTPUT_BACKWARDS_INCOMPATIBLE,
+            'Node ‘%s’ stopped emitting its new value in '
+            'org.freedesktop.DBus.Properties.PropertiesChanged.'),
+        ('true', 'const'): (
+            OUTPUT_FORWARDS_INCOMPATIBLE,
+            'Node ‘%s’ stopped emitting '
+            'org.freedesktop.DBus.Properties.PropertiesChanged.'),
+        ('true', 'false'): (
+            OUTPUT_FORWARDS_INCOMPATIBLE,
+            'Node ‘%s’ stopped emitting '
+            'org.freedesktop.DBus.Properties.PropertiesChanged.'),
+        ('invalidates', 'true'): (
+            OUTPUT_BACKWARDS_INCOMPATIBLE,
+            'Node ‘%s’ started emitting its new value in '
+            'org.freedesktop.DBus.Properties.PropertiesChanged.'),
+        ('invalidates', 'const'): (
+            OUTPUT_FORWARDS_INCOMPATIBLE,
+            'Node ‘%s’ stopped emitting '
+            'org.freedesktop.DBus.Properties.PropertiesChanged.'),
+        ('invalidates', 'false'): (
+            OUTPUT_FORWARDS_INCOMPATIBLE,
+            'Node ‘%s’ stopped emitting '
+            'org.freedesktop.DBus.Properties.PropertiesChanged.'),
+        ('const', 'true'): (
+            OUTPUT_BACKWARDS_INCOMPATIBLE,
+            'Node ‘%s’ started emitting '
+            'org.freedesktop.DBus.Properties.PropertiesChanged.'),
+        ('const', 'invalidates'): (
+            OUTPUT_BACKWARDS_INCOMPATIBLE,
+            'Node ‘%s’ started emitting '
+            'org.freedesktop.DBus.Properties.PropertiesChanged.'),
+        ('const', 'false'): (
+            OUTPUT_BACKWARDS_INCOMPATIBLE,
+            'Node ‘%s’ stopped being a constant.'),
+        ('false', 'true'): (
+            OUTPUT_BACKWARDS_INCOMPATIBLE,
+            'Node ‘%s’ started emitting '
+            'org.freedesktop.DBus.Properties.PropertiesChanged.'),
+        ('false', 'invalidates'): (
+            OUTPUT_BACKWARDS_INCOMPATIBLE,
+            'Node ‘%s’ started emitting '
+            'org.freedesktop.DBus.Properties.PropertiesChanged.'),
+        ('false', 'const'): (
+            OUTPUT_FORWARDS_INCOMPATIBLE,
+            'Node ‘%s’ became a constant.'),
+    }
+
     def __init__(self, old_interfaces, new_interfaces,
                  enabled_warnings=None, disabled_warnings=None,
                  new_filename=None):
@@ -76,17 +149,21 @@ class InterfaceComparator(object):
         self._old_interfaces = old_interfaces
         self._new_interfaces = new_interfaces
         self._new_filename = new_filename
-        self._output = []
+        self._output = deque()
 
-        if enabled_warnings is not None:
-            self._enabled_warnings = enabled_warnings
-        else:
-            self._enabled_warnings = WARNING_CATEGORIES
+        # (old, new) EmitsChangedSignal values of the interfaces currently
+        # being compared, set by _compare_interfaces().
+        self._interface_ecs = None
 
-        if disabled_warnings is not None:
-            self._disabled_warnings = disabled_warnings
-        else:
-            self._disabled_warnings = []
+        if enabled_warnings is None:
+            enabled_warnings = WARNING_CATEGORIES
+        if disabled_warnings is None:
+            disabled_warnings = []
+
+        # Disabling a category or code always overrides enabling it.
+        self._disabled_warnings = frozenset(disabled_warnings)
+        self._enabled_warnings = \
+            frozenset(enabled_warnings) - self._disabled_warnings
 
     @staticmethod
     def get_output_codes():
@@ -133,16 +210,24 @@ class InterfaceComparator(object):
             'argument-direction-changed-out-in',
         ]
 
-    def _issue_output(self, level, code, message):
-        """Append a message to the comparator output."""
+    def _issue_output(self, level, code, message, *args):
+        """
+        Append a message to the comparator output, if it is enabled.
+
+        If any `args` are given, `message` is formatted with them, but only if
+        the message is going to be output.
+        """
+        if not self._warning_enabled(level, code):
+            return
+
+        if args:
+            message = message % args
         self._output.append((self._new_filename, level, code, message))
 
     def _warning_enabled(self, level, code):
         """Determine whether the given output level is enabled for output."""
-        return ((level in self._enabled_warnings and
-                 level not in self._disabled_warnings and
-                 code not in self._disabled_warnings) or
-                (code in self._enabled_warnings and
+        return (code in self._enabled_warnings or
+                (level in self._enabled_warnings and
                  code not in self._disabled_warnings))
 
     def get_output(self):
@@ -151,15 +236,8 @@ class InterfaceComparator(object):
 
         Disabled warnings will not be returned.
         """
-        out = []
-
-        for (filename, level, code, message) in self._output:
-            if not self._warning_enabled(level, code):
-                continue
-
-            out.append((filename, level, code, message))
-
-        return out
+        # Disabled warnings are dropped by _issue_output().
+        return list(self._output)
 
     def compare(self):
         """
@@ -170,268 +248,207 @@ class InterfaceComparator(object):
             The return value is affected by the categories of enabled
             warnings.
         """
-        self._output = []
+        self._output.clear()
 
-        for (name, interface) in self._old_interfaces.items():
-            # See if the old interface exists in the new file.
-            if name not in self._new_interfaces:
-                self._issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE,
-                                   'interface-removed',
-                                   'Interface ‘%s’ has been removed.' % name)
-            else:
-                # Compare the two.
-                self._compare_interfaces(interface, self._new_interfaces[name])
-
-        for (name, interface) in self._new_interfaces.items():
-            # See if the new interface exists in the old file.
-            if name not in self._old_interfaces:
-                self._issue_output(self.OUTPUT_FORWARDS_INCOMPATIBLE,
-                                   'interface-added',
-                                   'Interface ‘%s’ has been added.' % name)
+        self._compare_members(self._old_interfaces, self._new_interfaces,
+                              'interface', self._compare_interfaces)
 
         # Work out the exit status.
         return self.get_output()
 
     # pylint: disable=too-many-branches
-    def _compare_annotations(self, old_node, new_node):  # noqa
-        """Compare two ast.Annotation instances."""
+    def _compare_annotations(self, old_node, new_node,  # noqa
+                             ecs_defaults=('true', 'true')):
+        """
+        Compare the annotations on two AST nodes.
 
-        def _get_string_annotation(node, annotation_name, default):
+        Args:
+            old_node: old AST node
+            new_node: new AST node
+            ecs_defaults: (old, new) values to use for the EmitsChangedSignal
+                annotation if it is not set on the nodes; for properties, this
+                is the value for their interface
+        """
+
+        def _get_string_annotation(annotations, annotation_name, default):
             """
             Get an annotation value as a string.
 
             Reference: http://goo.gl/3EtdNf
 
             Returns:
-                The value of the `annotation_name` annotation as a string, or
-                `default` if no annotation exists by that name.
+                The value of the `annotation_name` annotation in the
+                `annotations` dict as a string, or `default` if no annotation
+                exists by that name.
             """
-            if annotation_name in node.annotations:
-                return node.annotations[annotation_name].value
-            return default
+            annotation = annotations.get(annotation_name)
+            if annotation is None:
+                return default
+            return annotation.value
 
-        def _get_bool_annotation(node, annotation_name, default):
+        def _get_bool_annotation(annotations, annotation_name, default):
             """
             Get an annotation value as a boolean.
 
             Reference: http://goo.gl/3EtdNf
 
             Returns:
-                The value of the `annotation_name` annotation as a boolean, or
-                `default` if no annotation exists by that name.
+                The value of the `annotation_name` annotation in the
+                `annotations` dict as a boolean, or `default` if no annotation
+                exists by that name.
             """
-            if annotation_name in node.annotations:
-                return node.annotations[annotation_name].value == 'true'
-            return default
+            annotation = annotations.get(annotation_name)
+            if annotation is None:
+                return default
+            return annotation.value == 'true'
 
-        def _get_ecs_annotation(node):
-            """
-            Get the value of the EmitsChangedSignal annotation.
+        old_name = None
 
-            Reference: http://goo.gl/3EtdNf
+        def _old_name():
+            """Format the name of `old_node`, at most once."""
+            nonlocal old_name
+            if old_name is None:
+                old_name = old_node.format_name()
+            return old_name
 
-            Returns:
-                The value of the
-                `org.freedesktop.DBus.Property.EmitsChangedSignal` annotation,
-                if it exists, or the default, calculated as per the
-                specification.
-            """
-            name = 'org.freedesktop.DBus.Property.EmitsChangedSignal'
+        issue_output = self._issue_output
+        old_annotations = old_node.annotations
+        new_annotations = new_node.annotations
 
-            if name in node.annotations:
-                return node.annotations[name].value
-            elif isinstance(node, ast.Property):
-                assert node.interface is not None
-                return _get_ecs_annotation(node.interface)
-            else:
-                return 'true'
-
-        old_deprecated = \
-            _get_bool_annotation(old_node,
-                                 'org.freedesktop.DBus.Deprecated', False)
-        new_deprecated = \
-            _get_bool_annotation(new_node,
-                                 'org.freedesktop.DBus.Deprecated', False)
+        old_deprecated = _get_bool_annotation(old_annotations,
+                                              _ANN_DEPRECATED, False)
+        new_deprecated = _get_bool_annotation(new_annotations,
+                                              _ANN_DEPRECATED, False)
 
         if old_deprecated and not new_deprecated:
-            self._issue_output(self.OUTPUT_INFO, 'undeprecated',
-                               'Node ‘%s’ has been un-deprecated.' %
-                               old_node.format_name())
+            issue_output(self.OUTPUT_INFO, 'undeprecated',
+                         'Node ‘%s’ has been un-deprecated.',
+                         _old_name())
         elif not old_deprecated and new_deprecated:
-            self._issue_output(self.OUTPUT_INFO, 'deprecated',
-                               'Node ‘%s’ has been deprecated.' %
-                               old_node.format_name())
+            issue_output(self.OUTPUT_INFO, 'deprecated',
+                         'Node ‘%s’ has been deprecated.',
+                         _old_name())
 
-        old_c_symbol = \
-            _get_string_annotation(old_node,
-                                   'org.freedesktop.DBus.GLib.CSymbol', '')
-        new_c_symbol = \
-            _get_string_annotation(new_node,
-                                   'org.freedesktop.DBus.GLib.CSymbol', '')
+        old_c_symbol = _get_string_annotation(old_annotations,
+                                              _ANN_CSYMBOL, '')
+        new_c_symbol = _get_string_annotation(new_annotations,
+                                              _ANN_CSYMBOL, '')
 
         if old_c_symbol != new_c_symbol:
-            self._issue_output(self.OUTPUT_INFO, 'c-symbol-changed',
-                               'Node ‘%s’ has changed its C symbol from ‘%s’ '
-                               'to ‘%s’.' %
-                               (old_node.format_name(), old_c_symbol,
-                                new_c_symbol))
-
-        old_no_reply = \
-            _get_bool_annotation(old_node,
-                                 'org.freedesktop.DBus.Method.NoReply', False)
-        new_no_reply = \
-            _get_bool_annotation(new_node,
-                                 'org.freedesktop.DBus.Method.NoReply', False)
+            issue_output(self.OUTPUT_INFO, 'c-symbol-changed',
+                         'Node ‘%s’ has changed its C symbol from ‘%s’ '
+                         'to ‘%s’.',
+                         _old_name(), old_c_symbol,
+                         new_c_symbol)
+
+        old_no_reply = _get_bool_annotation(old_annotations,
+                                            _ANN_NOREPLY, False)
+        new_no_reply = _get_bool_annotation(new_annotations,
+                                            _ANN_NOREPLY, False)
 
         if old_no_reply and not new_no_reply:
-            self._issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE,
-                               'reply-added',
-                               'Node ‘%s’ has been marked as returning a '
-                               'reply.' % old_node.format_name())
+            issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE,
+                         'reply-added',
+                         'Node ‘%s’ has been marked as returning a '
+                         'reply.', _old_name())
         elif not old_no_reply and new_no_reply:
-            self._issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE,
-                               'reply-removed',
-                               'Node ‘%s’ has been marked as not returning a '
-                               'reply.' % old_node.format_name())
-
-        old_ecs = _get_ecs_annotation(old_node)
-        new_ecs = _get_ecs_annotation(new_node)
-        output_code = 'ecs-changed-%s-%s' % (old_ecs, new_ecs)
-
-        #                                 New
-        #                   | true | invalidates | const | false
-        #     | true        | xxxx | B2          | F3    | F3
-        # Old | invalidates | B2   | xxxxxxxxxxx | F3    | F3
-        #     | const       | B1   | B1          | xxxxx | B4
-        #     | false       | B1   | B1          | F4    | xxxxx
-        #
-        # B = Backwards-compatible; F = Forwards-compatible
-        # 1 = Started notifying
-        # 2 = Property switched lists in PropertiesChanged
-        # 3 = Stopped notifying
-        # 4 = const semantics changed
-
-        if old_ecs in ['true', 'invalidates'] and \
-           new_ecs in ['false', 'const']:
-            self._issue_output(self.OUTPUT_FORWARDS_INCOMPATIBLE, output_code,
-                               'Node ‘%s’ stopped emitting '
-                               'org.freedesktop.DBus.Properties.'
-                               'PropertiesChanged.' %
-                               old_node.format_name())
-        elif (old_ecs in ['false', 'const'] and
-              new_ecs in ['true', 'invalidates']):
-            self._issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE, output_code,
-                               'Node ‘%s’ started emitting '
-                               'org.freedesktop.DBus.Properties.'
-                               'PropertiesChanged.' %
-                               old_node.format_name())
-        elif old_ecs == 'true' and new_ecs == 'invalidates':
-            self._issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE, output_code,
-                               'Node ‘%s’ stopped emitting its new value in '
-                               'org.freedesktop.DBus.Properties.'
-                               'PropertiesChanged.' %
-                               old_node.format_name())
-        elif old_ecs == 'invalidates' and new_ecs == 'true':
-            self._issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE, output_code,
-                               'Node ‘%s’ started emitting its new value in '
-                               'org.freedesktop.DBus.Properties.'
-                               'PropertiesChanged.' %
-                               old_node.format_name())
-        elif old_ecs == 'const' and new_ecs == 'false':
-            self._issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE, output_code,
-                               'Node ‘%s’ stopped being a constant.' %
-                               old_node.format_name())
-        elif old_ecs == 'false' and new_ecs == 'const':
-            self._issue_output(self.OUTPUT_FORWARDS_INCOMPATIBLE, output_code,
-                               'Node ‘%s’ became a constant.' %
-                               old_node.format_name())
+            issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE,
+                         'reply-removed',
+                         'Node ‘%s’ has been marked as not returning a '
+                         'reply.', _old_name())
+
+        old_ecs = _get_string_annotation(old_annotations, _ANN_ECS,
+                                         ecs_defaults[0])
+        new_ecs = _get_string_annotation(new_annotations, _ANN_ECS,
+                                         ecs_defaults[1])
+
+        # Unchanged or invalid values have no entry.
+        transition = self._ECS_TRANSITIONS.get((old_ecs, new_ecs))
+        if transition is None:
+            return
+
+        (level, message) = transition
+        issue_output(level, 'ecs-changed-%s-%s' % (old_ecs, new_ecs),
+                     message, _old_name())
+
+    # pylint: disable=too-many-arguments
+    def _compare_members(self, old_members, new_members, kind, compare):
+        """
+        Compare two dicts of interfaces or interface members of the same kind.
 
-    # pylint: disable=too-many-branches
-    def _compare_interfaces(self, old_interface, new_interface):  # noqa
-        """Compare two ast.Interface instances."""
-        # Precondition of calling this method.
-        assert old_interface.name == new_interface.name
+        Members only in `old_members` are reported as removed, and members
+        only in `new_members` as added; `compare` is called with each pair of
+        members which are in both.
 
-        # Compare methods.
-        for (name, method) in old_interface.methods.items():
-            if name not in new_interface.methods:
+        Args:
+            old_members: dict mapping member or interface name to AST node
+            new_members: dict mapping member or interface name to AST node
+            kind: str, lower case name of the kind of member, for example
+                `method`
+            compare: function to compare an old and new member
+        """
+        for (name, old_member) in old_members.items():
+            new_member = new_members.get(name)
+            if new_member is None:
                 self._issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE,
-                                   'method-removed',
-                                   'Method ‘%s’ has been removed.' %
-                                   method.format_name())
+                                   '%s-removed' % kind,
+                                   '%s ‘%s’ has been removed.',
+                                   kind.capitalize(),
+                                   old_member.format_name())
             else:
-                self._compare_methods(method, new_interface.methods[name])
+                compare(old_member, new_member)
 
-        for (name, method) in new_interface.methods.items():
-            if name not in old_interface.methods:
+        for (name, new_member) in new_members.items():
+            if name not in old_members:
                 self._issue_output(self.OUTPUT_FORWARDS_INCOMPATIBLE,
-                                   'method-added',
-                                   'Method ‘%s’ has been added.' %
-                                   method.format_name())
+                                   '%s-added' % kind,
+                                   '%s ‘%s’ has been added.',
+                                   kind.capitalize(),
+                                   new_member.format_name())
 
-        # Compare properties
-        for (name, prop) in old_interface.properties.items():
-            if name not in new_interface.properties:
-                self._issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE,
-                                   'property-removed',
-                                   'Property ‘%s’ has been removed.' %
-                                   prop.format_name())
-            else:
-                self._compare_properties(prop, new_interface.properties[name])
+    def _compare_interfaces(self, old_interface, new_interface):
+        """Compare two ast.Interface instances."""
+        # Precondition of calling this method.
+        assert old_interface.name == new_interface.name
 
-        for (name, prop) in new_interface.properties.items():
-            if name not in old_interface.properties:
-                self._issue_output(self.OUTPUT_FORWARDS_INCOMPATIBLE,
-                                   'property-added',
-                                   'Property ‘%s’ has been added.' %
-                                   prop.format_name())
+        # Look up the interface-level EmitsChangedSignal values once, rather
+        # than once for each property which falls back to them.
+        self._interface_ecs = (self._get_interface_ecs(old_interface),
+                               self._get_interface_ecs(new_interface))
 
-        # Compare signals
-        for (name, signal) in old_interface.signals.items():
-            if name not in new_interface.signals:
-                self._issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE,
-                                   'signal-removed',
-                                   'Signal ‘%s’ has been removed.' %
-                                   signal.format_name())
-            else:
-                self._compare_signals(signal,
-                                      new_interface.signals[name])
+        self._compare_members(old_interface.methods, new_interface.methods,
+                              'method', self._compare_methods)
+        self._compare_members(old_interface.properties,
+                              new_interface.properties,
+                              'property', self._compare_properties)
+        self._compare_members(old_interface.signals, new_interface.signals,
+                              'signal', self._compare_signals)
 
-        for (name, signal) in new_interface.signals.items():
-            if name not in old_interface.signals:
-                self._issue_output(self.OUTPUT_FORWARDS_INCOMPATIBLE,
-                                   'signal-added',
-                                   'Signal ‘%s’ has been added.' %
-                                   signal.format_name())
+        self._interface_ecs = None
 
         # Compare annotations
         self._compare_annotations(old_interface, new_interface)
 
+    @staticmethod
+    def _get_interface_ecs(interface):
+        """
+        Get the value of an interface’s EmitsChangedSignal annotation.
+
+        Returns:
+            The annotation value, or ‘true’ if it is not set.
+        """
+        annotation = interface.annotations.get(_ANN_ECS)
+        if annotation is None:
+            return 'true'
+        return annotation.value
+
     def _compare_methods(self, old_method, new_method):
         """Compare two ast.Method instances."""
         # Precondition of calling this method.
         assert old_method.name == new_method.name
 
         # Compare the argument lists.
-        n_old_args = len(old_method.arguments)
-        n_new_args = len(new_method.arguments)
-
-        for i in range(max(n_old_args, n_new_args)):
-            if i >= n_old_args:
-                self._issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE,
-                                   'argument-added',
-                                   'Argument %s '
-                                   'has been added.' %
-                                   new_method.arguments[i].format_name())
-            elif i >= n_new_args:
-                self._issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE,
-                                   'argument-removed',
-                                   'Argument %s '
-                                   'has been removed.' %
-                                   old_method.arguments[i].format_name())
-            else:
-                self._compare_arguments(old_method.arguments[i],
-                                        new_method.arguments[i])
+        self._compare_arg_list(old_method.arguments, new_method.arguments)
 
         # Compare annotations
         self._compare_annotations(old_method, new_method)
@@ -445,32 +462,39 @@ class InterfaceComparator(object):
             self._issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE,
                                'property-type-changed',
                                'Property ‘%s’ has changed type from ‘%s’ '
-                               'to ‘%s’.' %
-                               (old_property.format_name(),
-                                old_property.type, new_property.type))
-
-        error_code = 'property-access-changed-%s-%s' % \
-                     (old_property.access, new_property.access)
-
-        if (old_property.access == ast.Property.ACCESS_READ or
-            old_property.access == ast.Property.ACCESS_WRITE) and \
-           new_property.access == ast.Property.ACCESS_READWRITE:
-            # Property has become less restrictive.
-            self._issue_output(self.OUTPUT_FORWARDS_INCOMPATIBLE, error_code,
-                               'Property ‘%s’ has changed access from '
-                               '‘%s’ to ‘%s’, becoming less restrictive.' %
-                               (old_property.format_name(),
-                                old_property.access, new_property.access))
-        elif old_property.access != new_property.access:
-            # Access has changed incompatibly.
-            self._issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE, error_code,
-                               'Property ‘%s’ has changed access from '
-                               '‘%s’ to ‘%s’.' %
-                               (old_property.format_name(),
-                                old_property.access, new_property.access))
-
-        # Compare annotations
-        self._compare_annotations(old_property, new_property)
+                               'to ‘%s’.',
+                               old_property.format_name(),
+                               old_property.type, new_property.type)
+
+        if old_property.access != new_property.access:
+            error_code = 'property-access-changed-%s-%s' % \
+                         (old_property.access, new_property.access)
+
+            if (old_property.access == ast.Property.ACCESS_READ or
+                    old_property.access == ast.Property.ACCESS_WRITE) and \
+               new_property.access == ast.Property.ACCESS_READWRITE:
+                # Property has become less restrictive.
+                self._issue_output(self.OUTPUT_FORWARDS_INCOMPATIBLE,
+                                   error_code,
+                                   'Property ‘%s’ has changed access from '
+                                   '‘%s’ to ‘%s’, becoming less '
+                                   'restrictive.',
+                                   old_property.format_name(),
+                                   old_property.access, new_property.access)
+            else:
+                # Access has changed incompatibly.
+                self._issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE,
+                                   error_code,
+                                   'Property ‘%s’ has changed access from '
+                                   '‘%s’ to ‘%s’.',
+                                   old_property.format_name(),
+                                   old_property.access, new_property.access)
+
+        # Compare annotations, falling back to the interface’s
+        # EmitsChangedSignal values.
+        assert self._interface_ecs is not None
+        self._compare_annotations(old_property, new_property,
+                                  self._interface_ecs)
 
     def _compare_signals(self, old_signal, new_signal):
         """Compare two ast.Signal instances."""
@@ -478,28 +502,29 @@ class InterfaceComparator(object):
         assert old_signal.name == new_signal.name
 
         # Compare the argument lists.
-        n_old_args = len(old_signal.arguments)
-        n_new_args = len(new_signal.arguments)
+        self._compare_arg_list(old_signal.arguments, new_signal.arguments)
+
+        # Compare annotations
+        self._compare_annotations(old_signal, new_signal)
 
-        for i in range(max(n_old_args, n_new_args)):
-            if i >= n_old_args:
+    def _compare_arg_list(self, old_args, new_args):
+        """Compare two lists of ast.Argument instances by position."""
+        # Arguments are never None, so None marks the end of a shorter list.
+        for (old_arg, new_arg) in zip_longest(old_args, new_args):
+            if old_arg is None:
                 self._issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE,
                                    'argument-added',
                                    'Argument %s '
-                                   'has been added.' %
-                                   new_signal.arguments[i].format_name())
-            elif i >= n_new_args:
+                                   'has been added.',
+                                   new_arg.format_name())
+            elif new_arg is None:
                 self._issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE,
                                    'argument-removed',
                                    'Argument %s '
-                                   'has been removed.' %
-                                   old_signal.arguments[i].format_name())
+                                   'has been removed.',
+                                   old_arg.format_name())
             else:
-                self._compare_arguments(old_signal.arguments[i],
-                                        new_signal.arguments[i])
-
-        # Compare annotations
-        self._compare_annotations(old_signal, new_signal)
+                self._compare_arguments(old_arg, new_arg)
 
     def _compare_arguments(self, old_arg, new_arg):
         """Compare two ast.Argument instances."""
@@ -507,26 +532,26 @@ class InterfaceComparator(object):
             self._issue_output(self.OUTPUT_INFO,
                                'argument-name-changed',
                                'Argument %s has changed '
-                               'name from ‘%s’ to ‘%s’.' %
-                               (old_arg.pretty_name,
-                                old_arg.name, new_arg.name))
+                               'name from ‘%s’ to ‘%s’.',
+                               old_arg.pretty_name,
+                               old_arg.name, new_arg.name)
 
         if old_arg.type != new_arg.type:
             self._issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE,
                                'argument-type-changed',
                                'Argument %s has changed '
-                               'type from ‘%s’ to ‘%s’.' %
-                               (old_arg.pretty_name,
-                                old_arg.type, new_arg.type))
+                               'type from ‘%s’ to ‘%s’.',
+                               old_arg.pretty_name,
+                               old_arg.type, new_arg.type)
 
         if old_arg.direction != new_arg.direction:
             self._issue_output(self.OUTPUT_BACKWARDS_INCOMPATIBLE,
                                'argument-direction-changed-%s-%s' %
                                (old_arg.direction, new_arg.direction),
                                'Argument %s has changed '
-                               'direction from ‘%s’ to ‘%s’.' %
-                               (old_arg.pretty_name,
-                                old_arg.direction, new_arg.direction))
+                               'direction from ‘%s’ to ‘%s’.',
+                               old_arg.pretty_name,
+                               old_arg.direction, new_arg.direction)
 
         # Compare annotations
         self._compare_annotations(old_arg, new_arg)
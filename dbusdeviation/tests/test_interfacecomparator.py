@@ -26,39 +26,21 @@ Unit tests for dbus-interface-diff
 
 from dbusapi.interfaceparser import InterfaceParser
 from dbusdeviation.interfacecomparator import InterfaceComparator
-import os
-import tempfile
 import unittest
 
 
-def _create_temp_xml_file(xml):
-    """Create a temporary XML file with the given contents."""
-    tmp_fd, tmp_name = tempfile.mkstemp(suffix='.xml', text=True)
-    xml_fd = os.fdopen(tmp_fd, 'wt')
-    xml_fd.write(xml)
-    xml_fd.close()
-
-    return tmp_name
-
-
 # pylint: disable=too-many-public-methods
 class TestComparatorErrors(unittest.TestCase):
     """Test log output from InterfaceComparator."""
 
     def _test_comparator(self, old_xml, new_xml):
         """Build an InterfaceComparator for the two parsed XML snippets."""
-        old_tmpfile = _create_temp_xml_file(old_xml)
-        new_tmpfile = _create_temp_xml_file(new_xml)
-
-        old_parser = InterfaceParser(old_tmpfile)
-        new_parser = InterfaceParser(new_tmpfile)
+        old_parser = InterfaceParser.from_string(old_xml)
+        new_parser = InterfaceParser.from_string(new_xml)
 
         old_interfaces = old_parser.parse()
         new_interfaces = new_parser.parse()
 
-        os.unlink(new_tmpfile)
-        os.unlink(old_tmpfile)
-
         self.assertEqual(old_parser.get_output(), [])
         self.assertEqual(new_parser.get_output(), [])
 
@@ -625,6 +607,42 @@ class TestComparatorErrors(unittest.TestCase):
             ])
 
 
+class TestComparatorWarnings(unittest.TestCase):
+    """Test enabling and disabling warnings in InterfaceComparator."""
+
+    def _test_codes(self, enabled_warnings, disabled_warnings):
+        """Compare two interfaces and return the output codes."""
+        old_interfaces = InterfaceParser.from_string(
+            "<node><interface name='I.A'/></node>").parse()
+        new_interfaces = InterfaceParser.from_string(
+            "<node><interface name='I.B'/></node>").parse()
+        comparator = InterfaceComparator(old_interfaces, new_interfaces,
+                                         enabled_warnings, disabled_warnings)
+        return [code for (_, _, code, _) in comparator.compare()]
+
+    def test_default(self):
+        self.assertEqual(self._test_codes(None, None),
+                         ['interface-removed', 'interface-added'])
+
+    def test_disabled_category(self):
+        self.assertEqual(self._test_codes(None, ['forwards-compatibility']),
+                         ['interface-removed'])
+
+    def test_disabled_code(self):
+        self.assertEqual(self._test_codes(None, ['interface-removed']),
+                         ['interface-added'])
+
+    def test_enabled_code(self):
+        self.assertEqual(self._test_codes(['interface-added'], None),
+                         ['interface-added'])
+
+    def test_enabled_code_in_disabled_category(self):
+        self.assertEqual(self._test_codes(['backwards-compatibility',
+                                           'interface-added'],
+                                          ['forwards-compatibility']),
+                         ['interface-removed', 'interface-added'])
+
+
 if __name__ == '__main__':
     # Run test suite
     unittest.main()
@@ -71,38 +71,33 @@ def _parse_file(filename, parser):
             sys.exit(1)
 
 
+# Terminal colours and human-readable names for each warning level.
+_LEVEL_COLOURS = {
+    'info': '\033[96;1m',
+    'forwards-compatibility': '\033[35;1m',
+    'backwards-compatibility': '\033[91;1m',
+    'parser': '\033[91;1m',
+}
+_LEVEL_FORMATS = {
+    'info': 'note',
+    'forwards-compatibility': 'warn',
+    'backwards-compatibility': 'error',
+    'parser': 'error',
+}
+
+
 def _format_level(level, enable_colour=True, justified_length=0):
     """Format a warning level as a human-readable string."""
-    colours = {
-        'info': '\033[96;1m',
-        'forwards-compatibility': '\033[35;1m',
-        'backwards-compatibility': '\033[91;1m',
-        'parser': '\033[91;1m',
-    }
-    formats = {
-        'info': 'note',
-        'forwards-compatibility': 'warn',
-        'backwards-compatibility': 'error',
-        'parser': 'error',
-    }
-
-    out = formats[level]
+    out = _LEVEL_FORMATS[level]
 
     if justified_length > 0:
         out = out.rjust(justified_length)
     if enable_colour:
-        out = colours[level] + out + '\033[0m'
+        out = _LEVEL_COLOURS[level] + out + '\033[0m'
 
     return out
 
 
-def _get_fd_for_level(level):
-    """Get the output file descriptor to use for the output level."""
-    if level == InterfaceComparator.OUTPUT_INFO:
-        return sys.stdout
-    return sys.stderr
-
-
 def _print_output(output, include_uris=True, enable_colour=True):
     """
     Print all the log messages generated by the latest call to compare().
@@ -110,16 +105,23 @@ def _print_output(output, include_uris=True, enable_colour=True):
     The messages will be printed to stdout and/or stderr as appropriate.
     """
     # Justify the error codes.
-    try:
-        max_code_len = max([len(o[2]) for o in output])
-        max_level_len = max([len(_format_level(o[1], False)) for o in output])
-    except ValueError:
-        max_code_len = 0
-        max_level_len = 0
+    max_code_len = max((len(o[2]) for o in output), default=0)
+    max_level_len = max((len(_LEVEL_FORMATS[o[1]]) for o in output),
+                        default=0)
+
+    # Write consecutive messages for the same file descriptor in one go, so
+    # that the interleaving of stdout and stderr is preserved.
+    current_fd = None
+    lines = []
 
     for (filename, level, code, message) in output:
         formatted_level = _format_level(level, enable_colour, max_level_len)
-        fd_for_level = _get_fd_for_level(level)
+        # Info goes to stdout; everything else to stderr. Look the streams up
+        # here in case they have been replaced since import.
+        if level == InterfaceComparator.OUTPUT_INFO:
+            fd_for_level = sys.stdout
+        else:
+            fd_for_level = sys.stderr
         errors_page = 'https://tecnocode.co.uk/dbus-deviation/errors.html'
         explanation_uri = '%s#%s' % (errors_page, code)
         formatted_code = code.rjust(max_code_len)
@@ -127,19 +129,25 @@ def _print_output(output, include_uris=True, enable_colour=True):
         if enable_colour:
             formatted_code = '\033[1m%s\033[0m' % formatted_code
             explanation_uri = '\033[90m%s\033[0m' % explanation_uri
-        else:
-            formatted_code = formatted_code
+
+        if fd_for_level is not current_fd:
+            if lines:
+                current_fd.write(''.join(lines))
+                lines = []
+            current_fd = fd_for_level
 
         if filename is None:
-            output = '%s: %s: %s\n' % \
-                     (formatted_level, formatted_code, message)
+            lines.append('%s: %s: %s\n' %
+                         (formatted_level, formatted_code, message))
         else:
-            output = '%s: %s: %s: %s\n' % \
-                     (filename, formatted_level, formatted_code, message)
+            lines.append('%s: %s: %s: %s\n' %
+                         (filename, formatted_level, formatted_code, message))
 
-        fd_for_level.write(output)
         if include_uris:
-            fd_for_level.write('   %s\n' % explanation_uri)
+            lines.append('   %s\n' % explanation_uri)
+
+    if lines:
+        current_fd.write(''.join(lines))
 
 
 def _calculate_exit_status(args, output):
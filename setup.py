@@ -91,10 +91,6 @@ setuptools.setup(
     include_package_data=True,
     exclude_package_data={'': ['.gitignore']},
     zip_safe=True,
-    setup_requires=[
-        'setuptools_git >= 0.3',
-        'sphinx',
-    ],
     install_requires=['lxml'],
     tests_require=[],
     entry_points={